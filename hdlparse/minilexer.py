@@ -12,18 +12,38 @@ __version__ = '1.0.5'
 class MiniLexer(object):
   '''Simple lexer state machine with regex matching rules'''
 
-  def __init__(self, tokens, flags=re.MULTILINE):
+  def __init__(self, tokens, flags=re.MULTILINE, trivia=None):
     '''Create a new lexer
+
+    The rules of each state are joined into a single regex so their patterns can't use
+    features that depend on the pattern standing alone. Numbered backreferences would
+    refer to the wrong group, a named group can't appear in more than one rule of a
+    state, and global inline flags such as (?i) can't be used. Pass flags instead or
+    use a scoped group like (?i:...).
     
     Args:
       tokens (dict(match rules)): Hierarchical dict of states with a list of regex patterns and transitions
       flags (int): Optional regex flags
+      trivia (dict(callable)): Optional dict of states with a function taking (text, pos) and
+        returning the position to resume matching from on entering the state. Text it skips
+        must not contain any token of the state.
     '''
     self.tokens = {}
-
-    # Pre-process the state definitions
+    self.trivia = trivia if trivia is not None else {}
+
+    # Pre-process the state definitions. Patterns are compiled once here so that
+    # lexers built at module scope pay the compile cost at import time only.
+    #
+    # All rules for a state are fused into a single alternation. Alternation is
+    # tried left to right so rule priority is unchanged. Each rule is followed by
+    # an empty marker group which, closing last, becomes the match's lastindex.
+    # That index selects the rule's action, transition, and the slice of
+    # subgroups it owns. Keeping the marker at the end leaves each alternative
+    # starting with its own first character so the regex engine can reject
+    # rules that can't match at a position before trying them.
     for state, patterns in tokens.items():
-      full_patterns = []
+      alternatives = []
+      rules = [None]
       for p in patterns:
         pat = re.compile(p[0], flags)
         action = p[1]
@@ -36,8 +56,12 @@ class MiniLexer(object):
           except (IndexError, ValueError):
             new_state = -1
 
-        full_patterns.append((pat, action, new_state))
-      self.tokens[state] = full_patterns
+        alternatives.append('(?:{})()'.format(p[0]))
+        first_group = len(rules) - 1
+        rules.extend([None] * pat.groups)
+        rules.append((action, new_state, first_group, first_group + pat.groups))
+
+      self.tokens[state] = (re.compile('|'.join(alternatives), flags), rules)
 
 
   def run(self, text):
@@ -47,41 +71,45 @@ class MiniLexer(object):
       text (str): Text to apply lexer to
 
     Yields:
-      A sequence of lexer matches.
+      A sequence of lexer matches. Each is a tuple of the (start, end) offsets of the
+      match within text, its action, and the subgroups of the matching rule.
     '''
 
+    # Hot loop state is held in locals to avoid repeated attribute and dict lookups
+    states = {state: (pattern.finditer, rules, self.trivia.get(state))
+      for state, (pattern, rules) in self.tokens.items()}
+
     stack = ['root']
     pos = 0
 
-    patterns = self.tokens[stack[-1]]
+    finditer, rules, skip = states['root']
 
+    # Text that matches no rule is skipped. Iterating over the leftmost matches
+    # lets the regex engine do that scan in C and advance from one token to the
+    # next without stepping through the text in Python. The iterator is only
+    # restarted when the state changes.
     while True:
-      for pat, action, new_state in patterns:
-        m = pat.match(text, pos)
-        if m:
-          if action:
-            #print('## MATCH: {} -> {}'.format(m.group(), action))
-            yield (pos, m.end()-1), action, m.groups()
+      if skip:
+        pos = skip(text, pos)
 
-          pos = m.end()
+      for m in finditer(text, pos):
+        action, new_state, first_group, last_group = rules[m.lastindex]
 
-          if new_state:
-            if isinstance(new_state, int): # Pop states
-              del stack[new_state:]
-            else:
-              stack.append(new_state)
+        if action:
+          #print('## MATCH: {} -> {}'.format(m.group(), action))
+          yield (m.start(), m.end()-1), action, m.groups()[first_group:last_group]
 
-            #print('## CHANGE STATE:', pos, new_state, stack)
-            patterns = self.tokens[stack[-1]]
+        if new_state:
+          pos = m.end()
 
-          break
+          if isinstance(new_state, int): # Pop states
+            del stack[new_state:]
+          else:
+            stack.append(new_state)
 
-      else:
-        try:
-          if text[pos] == '\n':
-            pos += 1
-            continue
-          pos += 1
-        except IndexError:
+          #print('## CHANGE STATE:', pos, new_state, stack)
+          finditer, rules, skip = states[stack[-1]]
           break
 
+      else: # No more matches in this state
+        break
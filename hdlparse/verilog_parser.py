@@ -3,7 +3,10 @@
 # Distributed under the terms of the MIT license
 from __future__ import print_function
 
-import re, os, io, collections
+import re, os, io, sys, pickle, functools, tempfile
+from abc import ABCMeta
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from .minilexer import MiniLexer
 
 '''Verilog documentation parser
@@ -20,14 +23,13 @@ including their ports, parameters, and submodule instances. The parser handles:
 verilog_tokens = {
   'root': [
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
+    (r'//.*\n?', None),
     (r'\bmodule\s*(\w+)\s*', 'module', 'module'),
     (r'//#+(.*)\n', 'metacomment'),
   ],
   'module': [
-    (r'\s+', None),  # Skip whitespace first
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
+    (r'//.*\n?', None),
     (r'\bendmodule\b', 'end_module', '#pop'),  # Keep endmodule simple and high priority
     (r'parameter\s+(?:(signed|integer|realtime|real|time)\s+)?(\[[^]]+\])?', 'parameter_start', 'parameters'),
     (r'(input|inout|output)\s+(?:(reg|supply0|supply1|tri|triand|trior|tri0|tri1|wire|wand|wor|logic)\s+)?(?:(signed)\s+)?(\[[^]]+\])?', 'module_port_start', 'module_port'),
@@ -38,43 +40,66 @@ verilog_tokens = {
   ],
   'parameters': [
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
-    (r'\s*parameter\s+(?:(signed|integer|realtime|real|time)\s+)?(\[[^]]+\])?', 'parameter_start'),
-    (r'\s*(\w+)\s*=\s*([^,;\s]+)\s*', 'param_item_with_value'),
-    (r'\s*(\w+)[^),;]+', 'param_item'),
+    (r'//.*\n?', None),
+    (r'parameter\s+(?:(signed|integer|realtime|real|time)\s+)?(\[[^]]+\])?', 'parameter_start'),
+    (r'(\w+)\s*=\s*([^,;\s]+)\s*', 'param_item_with_value'),
+    (r'(\w+)[^),;]+', 'param_item'),
     (r',', None),
     (r'[);]', None, '#pop'),
     (r'//#\s*{{(.*)}}\n', 'section_meta'),
   ],
   'module_port': [
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
-    (r'\s*(input|inout|output)\s+(?:(reg|supply0|supply1|tri|triand|trior|tri0|tri1|wire|wand|wor)\s+)?(signed)?\s*(\[[^]]+\])?', 'module_port_start'),
-    (r'\s*(\w+)\s*,?', 'port_param'),
+    (r'//.*\n?', None),
+    (r'(input|inout|output)\s+(?:(reg|supply0|supply1|tri|triand|trior|tri0|tri1|wire|wand|wor)\s+)?(signed)?\s*(\[[^]]+\])?', 'module_port_start'),
+    (r'(\w+)\s*,?', 'port_param'),
     (r'[);]', None, '#pop'),
     (r'//#\s*{{(.*)}}\n', 'section_meta'),
   ],
   'submodule_params': [
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
-    (r'\s*\)\s*(\w+)\s*\(', 'submodule_param_end'),  # End of params, start of ports
+    (r'//.*\n?', None),
+    (r'\)\s*(\w+)\s*\(', 'submodule_param_end'),  # End of params, start of ports
     (r'\);', 'end_submodule', '#pop'),
     (r'\.[^,)]+', None),  # Parameter and Ports assignments
     (r',', None),
   ],
   'submodule': [
     (r'/\*', 'block_comment', 'block_comment'),
-    (r'//.*\n', None),
+    (r'//.*\n?', None),
     (r'\);', 'end_submodule', '#pop'),
     (r'\.[^,)]+', None),  # Ports assignments
   ],
   'block_comment': [
-    (r'\s*\*/', 'end_comment', '#pop'),
+    (r'\*/', 'end_comment', '#pop'),
   ],
 }
 
 
-VerilogLexer = MiniLexer(verilog_tokens)
+def _skip_to_module(text, pos):
+  '''Skip text outside of modules on entering the root state.
+
+  Every rule in the root state starts with "/" or "module" so everything up to the
+  next occurrence of either can be passed over with str.find(). Comments within a
+  state are handled by the comment rules in verilog_tokens.
+
+  Args:
+    text (str): Source text being lexed.
+    pos (int): Position to start skipping from.
+  Returns:
+    int: Position of the next possible root state token.
+  '''
+  next_module = text.find('module', pos)
+  if next_module < 0:
+    next_module = len(text)
+
+  next_slash = text.find('/', pos, next_module)
+  return next_slash if next_slash >= 0 else next_module
+
+# Token patterns are compiled once at import. MiniLexer.run() applies them in place
+# with finditer(text, pos) and never slices the source, so token offsets are absolute
+# positions in the original text.
+VerilogLexer = MiniLexer(verilog_tokens, trivia={'root': _skip_to_module})
 
 class VerilogObject(object):
   '''Base class for parsed Verilog objects.
@@ -84,6 +109,8 @@ class VerilogObject(object):
     kind (str): Type of the object (default: 'unknown')
     desc (str): Optional description/metacomment for the object
   '''
+  __slots__ = ('name', 'kind', 'desc')
+
   def __init__(self, name, desc=None):
     self.name = name
     self.kind = 'unknown'
@@ -99,6 +126,8 @@ class VerilogParameter(object):
     default_value (str): Default value of the parameter
     desc (str): Optional description/metacomment for the parameter
   '''
+  __slots__ = ('name', 'mode', 'data_type', 'default_value', 'desc')
+
   def __init__(self, name, mode=None, data_type=None, default_value=None, desc=None):
     self.name = name
     self.mode = mode
@@ -115,26 +144,129 @@ class VerilogParameter(object):
   def __repr__(self):
     return "VerilogParameter('{}')".format(self.name)
 
-class VerilogPort(object):
+class _VerilogPortBase(object):
+  '''Formatting shared by VerilogPort and VerilogPortView.
+
+  This class has no slots of its own so a VerilogPortView doesn't carry unused storage
+  for the attributes held by a VerilogPort.
+  '''
+  __slots__ = ()
+
+  def __str__(self):
+    return '{} : {} {}'.format(self.name, self.mode, self.data_type)
+
+  def __repr__(self):
+    return "VerilogPort('{}')".format(self.name)
+
+class VerilogPort(_VerilogPortBase, metaclass=ABCMeta):
   '''Port definition in a module.
   
+  VerilogPortView is registered as a virtual subclass so isinstance() checks against
+  VerilogPort accept the ports of a VerilogModule.
+
   Attributes:
     name (str): Name of the port
     mode (str): Port mode ('input', 'output', or 'inout')
     data_type (str): Data type of the port (e.g., 'wire', 'reg')
     desc (str): Optional description/metacomment for the port
   '''
+  __slots__ = ('name', 'mode', 'data_type', 'desc')
+
   def __init__(self, name, mode=None, data_type=None, desc=None):
     self.name = name
     self.mode = mode  # input, output, inout
     self.data_type = data_type  # wire, reg, etc.
     self.desc = desc
 
-  def __str__(self):
-    return '{} : {} {}'.format(self.name, self.mode, self.data_type)
+class VerilogPortView(_VerilogPortBase):
+  '''Port of a VerilogModule backed by the module's port arrays.
+
+  Reading or assigning an attribute accesses the module's corresponding port array
+  so changes made through a view are visible in the module. Views of the same port
+  compare equal.
+
+  Args:
+    module (VerilogModule): Module holding the port
+    index (int): Position of the port in the module's port arrays
+  '''
+  __slots__ = ('module', 'index')
+
+  def __init__(self, module, index):
+    self.module = module
+    self.index = index
+
+  def __eq__(self, other):
+    if not isinstance(other, VerilogPortView):
+      return NotImplemented
+    return self.module is other.module and self.index == other.index
+
+  def __hash__(self):
+    return hash((id(self.module), self.index))
+
+  @property
+  def name(self):
+    return self.module.port_names[self.index]
+
+  @name.setter
+  def name(self, value):
+    self.module.port_names[self.index] = value
+
+  @property
+  def mode(self):
+    return self.module.port_modes[self.index]
+
+  @mode.setter
+  def mode(self, value):
+    self.module.port_modes[self.index] = value
+
+  @property
+  def data_type(self):
+    return self.module.port_data_types[self.index]
+
+  @data_type.setter
+  def data_type(self, value):
+    self.module.port_data_types[self.index] = value
+
+  @property
+  def desc(self):
+    return self.module.port_descs[self.index]
+
+  @desc.setter
+  def desc(self, value):
+    self.module.port_descs[self.index] = value
+
+VerilogPort.register(VerilogPortView)
+
+class VerilogPortSequence(Sequence):
+  '''Read-only sequence of the ports of a VerilogModule.
+
+  Views are only built for the ports that are indexed or iterated over so taking the
+  length or a single port doesn't depend on the number of ports.
+
+  Args:
+    module (VerilogModule): Module holding the ports
+  '''
+  __slots__ = ('module',)
+
+  def __init__(self, module):
+    self.module = module
+
+  def __len__(self):
+    return len(self.module.port_names)
+
+  def __getitem__(self, index):
+    # Indexing a range applies Python's rules for negative indices, slices and IndexError
+    indices = range(len(self.module.port_names))[index]
+    if isinstance(index, slice):
+      return tuple(VerilogPortView(self.module, i) for i in indices)
+    return VerilogPortView(self.module, indices)
+
+  def __iter__(self):
+    module = self.module
+    return (VerilogPortView(module, i) for i in range(len(module.port_names)))
 
   def __repr__(self):
-    return "VerilogPort('{}')".format(self.name)
+    return repr(list(self))
 
 class VerilogSubModule(object):
   '''Submodule instance in a module.
@@ -145,6 +277,8 @@ class VerilogSubModule(object):
     port_connections (dict): Dictionary mapping port names to their connections
     desc (str): Optional description/metacomment for the submodule
   '''
+  __slots__ = ('module_type', 'instance_name', 'port_connections', 'desc')
+
   def __init__(self, module_type, instance_name, port_connections=None, desc=None):
     self.module_type = module_type
     self.instance_name = instance_name
@@ -160,14 +294,28 @@ class VerilogSubModule(object):
 class VerilogModule(VerilogObject):
   '''Module definition in Verilog.
   
+  Ports are stored as parallel arrays. The ports attribute presents them as a read-only
+  VerilogPortSequence that builds a VerilogPortView for each port as it is accessed.
+  Assign a new list of VerilogPort objects to ports, or edit the port arrays, to change
+  the ports. Building the views makes reading every port through ports much slower than
+  reading the port arrays directly so bulk consumers should use port_names, port_modes,
+  port_data_types, and port_descs instead.
+
   Attributes:
     name (str): Name of the module
-    ports (list): List of VerilogPort objects defining the module's ports
+    ports (VerilogPortSequence): VerilogPortView objects defining the module's ports
+    port_names (list): Names of the module's ports
+    port_modes (list): Modes of the module's ports
+    port_data_types (list): Data types of the module's ports
+    port_descs (list): Descriptions of the module's ports
     generics (list): List of VerilogParameter objects defining the module's parameters
     sections (dict): Dictionary mapping section names to lists of port names
     submodules (list): List of VerilogSubModule objects defining the module's submodules
     desc (str): Optional description/metacomment for the module
   '''
+  __slots__ = ('generics', 'port_names', 'port_modes', 'port_data_types', 'port_descs',
+    'sections', 'submodules')
+
   def __init__(self, name, ports, generics=None, sections=None, submodules=None, desc=None):
     VerilogObject.__init__(self, name, desc)
     self.kind = 'module'
@@ -177,6 +325,44 @@ class VerilogModule(VerilogObject):
     self.sections = sections if sections is not None else {}
     self.submodules = submodules if submodules is not None else []
 
+  @classmethod
+  def from_port_arrays(cls, name, port_names, port_modes, port_data_types, port_descs,
+      generics=None, sections=None, submodules=None, desc=None):
+    '''Create a module from parallel port arrays.
+
+    The arrays are used as-is without copying.
+
+    Args:
+      name (str): Name of the module
+      port_names (list): Names of the module's ports
+      port_modes (list): Modes of the module's ports
+      port_data_types (list): Data types of the module's ports
+      port_descs (list): Descriptions of the module's ports
+      generics (list): List of VerilogParameter objects
+      sections (dict): Dictionary mapping section names to lists of port names
+      submodules (list): List of VerilogSubModule objects
+      desc (str): Optional description/metacomment for the module
+    Returns:
+      VerilogModule: The new module.
+    '''
+    module = cls(name, (), generics, sections, submodules, desc)
+    module.port_names = port_names
+    module.port_modes = port_modes
+    module.port_data_types = port_data_types
+    module.port_descs = port_descs
+    return module
+
+  @property
+  def ports(self):
+    return VerilogPortSequence(self)
+
+  @ports.setter
+  def ports(self, ports):
+    self.port_names = [p.name for p in ports]
+    self.port_modes = [p.mode for p in ports]
+    self.port_data_types = [p.data_type for p in ports]
+    self.port_descs = [p.desc for p in ports]
+
   def __repr__(self):
     return "VerilogModule('{}') {}".format(self.name, self.ports)
 
@@ -194,6 +380,172 @@ def parse_verilog_file(fname):
     text = fh.read()
   return parse_verilog(text)
 
+# Shared copies of the port modes and net types captured by the lexer so that every
+# port and parameter refers to the same string object for these few values
+_interned_modes = {m: sys.intern(m) for m in ('input', 'output', 'inout')}
+_interned_net_types = {t: sys.intern(t) for t in ('wire', 'reg', 'logic', 'supply0', 'supply1',
+  'tri', 'triand', 'trior', 'tri0', 'tri1', 'wand', 'wor', 'signed', 'integer', 'realtime',
+  'real', 'time')}
+
+
+class _VerilogParseState(object):
+  '''Mutable state shared by the parse_verilog() action handlers'''
+  def __init__(self):
+    self.name = None
+    self.mode = None  # Set by each port declaration
+    self.ptype = 'wire'  # Default type
+
+    self.metacomments = []
+
+    self.generics = []
+    self.generic_names = set()
+    self.port_index = {}  # Port name to position in the port arrays
+    self.port_names = []
+    self.port_modes = []
+    self.port_data_types = []
+    self.port_descs = []
+    self.sections = []
+    self.port_param_index = 0
+    self.last_item = None  # (port_descs, index) of the last port for trailing metacomments
+
+    # Submodule parsing variables
+    self.current_submodule = None
+    self.submodules = []
+
+    self.objects = []
+
+
+def _on_metacomment(groups, st):
+  if st.last_item is None:
+    st.metacomments.append(groups[0])
+  else:
+    descs, index = st.last_item
+    descs[index] = groups[0]
+
+def _on_section_meta(groups, st):
+  st.sections.append((st.port_param_index, groups[0]))
+
+def _on_module(groups, st):
+  st.name = groups[0]
+  st.generics = []
+  st.generic_names = set()
+  st.port_index = {}
+  st.port_names = []
+  st.port_modes = []
+  st.port_data_types = []
+  st.port_descs = []
+  st.sections = []
+  st.port_param_index = 0
+  st.submodules = []
+  st.ptype = 'wire'  # Reset default type for new module
+
+def _on_submodule_param_start(groups, st):
+  module_type = groups[0]
+  st.current_submodule = VerilogSubModule(module_type, None)  # Instance name will be set later
+
+def _on_submodule_param_end(groups, st):
+  instance_name = groups[0]
+  if st.current_submodule:
+    st.current_submodule.instance_name = instance_name
+
+def _on_submodule_start(groups, st):
+  module_type, instance_name = groups
+  st.current_submodule = VerilogSubModule(module_type, instance_name)
+
+def _on_end_submodule(groups, st):
+  if st.current_submodule:
+    st.submodules.append(st.current_submodule)
+    st.current_submodule = None
+
+def _on_parameter_start(groups, st):
+  net_type, vec_range = groups
+
+  # Default type for parameters is wire
+  parts = [_interned_net_types.get(net_type, net_type) if net_type else 'wire']
+  if vec_range:
+    parts.append(vec_range)
+
+  st.ptype = ' '.join(parts)
+
+def _on_param_item_with_value(groups, st):
+  pname, pvalue = groups
+  pvalue = pvalue.strip()  # Remove any trailing whitespace
+  st.generics.append(VerilogParameter(pname, 'in', st.ptype, pvalue))
+  st.generic_names.add(pname)
+
+def _on_param_item(groups, st):
+  pname = groups[0].strip()  # Remove any trailing whitespace
+  if pname and pname not in st.generic_names:  # Avoid duplicates
+    st.generics.append(VerilogParameter(pname, 'in', st.ptype))
+    st.generic_names.add(pname)
+
+def _on_module_port_start(groups, st):
+  new_mode, net_type, signed, vec_range = groups
+
+  # Default type for ports is wire
+  parts = [_interned_net_types.get(net_type, net_type) if net_type else 'wire']
+  if signed:
+    parts.append(signed)
+  if vec_range:
+    parts.append(vec_range)
+
+  st.mode = _interned_modes.get(new_mode, new_mode)
+  st.ptype = ' '.join(parts)
+
+def _on_port_param(groups, st):
+  pname = groups[0]
+  index = st.port_index.get(pname)
+  if index is None:  # New port
+    index = st.port_index[pname] = len(st.port_names)
+    st.port_names.append(pname)
+    st.port_modes.append(st.mode)
+    st.port_data_types.append(st.ptype)
+    st.port_descs.append(None)
+  else:  # Redeclared port replaces the earlier one in place
+    st.port_modes[index] = st.mode
+    st.port_data_types[index] = st.ptype
+    st.port_descs[index] = None
+
+  st.port_param_index += 1
+  st.last_item = (st.port_descs, index)
+
+def _on_end_module(groups, st):
+  # Create sections dict from list of tuples
+  sections_dict = {}
+  port_names = st.port_names
+  last_pos = 0
+  for pos, section in st.sections:
+    if last_pos < len(port_names):
+      sections_dict[section] = port_names[last_pos:pos]
+    last_pos = pos
+
+  # Create the module object and add it to objects list
+  module = VerilogModule.from_port_arrays(st.name, st.port_names, st.port_modes,
+    st.port_data_types, st.port_descs, st.generics, sections_dict, st.submodules)
+  if st.metacomments:
+    module.desc = '\n'.join(st.metacomments)
+  st.objects.append(module)
+  st.metacomments = []
+
+
+# Lexer actions handled by parse_verilog(). Actions without an entry are ignored.
+_action_handlers = {
+  'metacomment': _on_metacomment,
+  'section_meta': _on_section_meta,
+  'module': _on_module,
+  'submodule_param_start': _on_submodule_param_start,
+  'submodule_param_end': _on_submodule_param_end,
+  'submodule_start': _on_submodule_start,
+  'end_submodule': _on_end_submodule,
+  'parameter_start': _on_parameter_start,
+  'param_item_with_value': _on_param_item_with_value,
+  'param_item': _on_param_item,
+  'module_port_start': _on_module_port_start,
+  'port_param': _on_port_param,
+  'end_module': _on_end_module,
+}
+
+
 def parse_verilog(text):
   '''Parse a text buffer of Verilog code.
 
@@ -211,128 +563,15 @@ def parse_verilog(text):
     list: List of VerilogModule objects found in the text.
   '''
   lex = VerilogLexer
+  handlers = _action_handlers
+  st = _VerilogParseState()
 
-  name = None
-  kind = None
-  mode = 'input'
-  ptype = 'wire'  # Default type
-
-  metacomments = []
-  param_items = []
-
-  generics = []
-  ports = collections.OrderedDict()
-  sections = []
-  port_param_index = 0
-  last_item = None
-
-  # Submodule parsing variables
-  current_submodule = None
-  submodules = []
-
-  objects = []
-  
   for pos, action, groups in lex.run(text):
-    if action == 'metacomment':
-      if last_item is None:
-        metacomments.append(groups[0])
-      else:
-        last_item.desc = groups[0]
-
-    if action == 'section_meta':
-      sections.append((port_param_index, groups[0]))
-
-    elif action == 'module':
-      kind = 'module'
-      name = groups[0]
-      generics = []
-      ports = collections.OrderedDict()
-      param_items = []
-      sections = []
-      port_param_index = 0
-      submodules = []
-      ptype = 'wire'  # Reset default type for new module
-
-    elif action == 'submodule_param_start':
-      module_type = groups[0]
-      current_submodule = VerilogSubModule(module_type, None)  # Instance name will be set later
-
-    elif action == 'submodule_param_end':
-      instance_name = groups[0]
-      if current_submodule:
-        current_submodule.instance_name = instance_name
-
-    elif action == 'submodule_start':
-      module_type, instance_name = groups
-      current_submodule = VerilogSubModule(module_type, instance_name)
-
-    elif action == 'end_submodule':
-      if current_submodule:
-        submodules.append(current_submodule)
-        current_submodule = None
-
-    elif action == 'parameter_start':
-      net_type, vec_range = groups
-
-      new_ptype = 'wire'  # Default type for parameters
-      if net_type is not None:
-        new_ptype = net_type
-
-      if vec_range is not None:
-        new_ptype += ' ' + vec_range
-
-      ptype = new_ptype
-
-    elif action == 'param_item_with_value':
-      pname, pvalue = groups
-      pvalue = pvalue.strip()  # Remove any trailing whitespace
-      generics.append(VerilogParameter(pname, 'in', ptype, pvalue))
-
-    elif action == 'param_item':
-      pname = groups[0].strip()  # Remove any trailing whitespace
-      if pname and not any(p.name == pname for p in generics):  # Avoid duplicates
-        generics.append(VerilogParameter(pname, 'in', ptype))
-
-    elif action == 'module_port_start':
-      new_mode, net_type, signed, vec_range = groups
-
-      new_ptype = 'wire'  # Default type for ports
-      if net_type is not None:
-        new_ptype = net_type
-
-      if signed is not None:
-        new_ptype += ' ' + signed
-
-      if vec_range is not None:
-        new_ptype += ' ' + vec_range
-
-      mode = new_mode
-      ptype = new_ptype
-      param_items = []
-
-    elif action == 'port_param':
-      pname = groups[0]
-      param_items.append(pname)
-      ports[pname] = VerilogPort(pname, mode, ptype)
-      port_param_index += 1
-      last_item = ports[pname]
-
-    elif action == 'end_module':
-      # Create sections dict from list of tuples
-      sections_dict = {}
-      last_pos = 0
-      for pos, section in sections:
-        if last_pos < len(ports):
-          sections_dict[section] = list(ports.keys())[last_pos:pos]
-        last_pos = pos
-
-      # Create the module object and add it to objects list
-      module = VerilogModule(name, list(ports.values()), generics, sections_dict, submodules)
-      if metacomments:
-        module.desc = '\n'.join(metacomments)
-      objects.append(module)
-      metacomments = []
-  return objects
+    handler = handlers.get(action)
+    if handler:
+      handler(groups, st)
+
+  return st.objects
 
 
 def is_verilog(fname):
@@ -346,14 +585,50 @@ def is_verilog(fname):
   return os.path.splitext(fname)[1].lower() in ('.vlog', '.v')
 
 
+def _parse_verilog_file_worker(fname):
+  '''Read and parse a Verilog file in a worker process'''
+  with io.open(fname, 'rt', encoding='utf-8') as fh:
+    return parse_verilog(fh.read())
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_verilog_cached(text):
+  '''Parse a text buffer once for all VerilogExtractor instances
+
+  The objects are cached in pickled form so each caller can unpickle its own copy.
+  '''
+  return pickle.dumps(parse_verilog(text), pickle.HIGHEST_PROTOCOL)
+
+
 class VerilogExtractor(object):
   '''Utility class that caches parsed Verilog objects.
   
   This class provides methods to parse Verilog files and text, with caching to avoid
-  re-parsing the same files multiple times.
+  re-parsing the same files multiple times. Files are cached by path along with their
+  modification time and size so edited files are parsed again and replace their old
+  entry. The cache can optionally be persisted to disk and reused by later processes.
+
+  Args:
+    cache_file (str, optional): Pickle file to load the cache from and save it to with flush().
   '''
-  def __init__(self):
+  def __init__(self, cache_file=None):
     self.object_cache = {}
+    self.cache_file = cache_file
+    self._cache_dirty = False
+
+    if cache_file is not None and os.path.exists(cache_file):
+      try:
+        with io.open(cache_file, 'rb') as fh:
+          loaded = pickle.load(fh)
+      except Exception:
+        # Unreadable, corrupt, or stale cache from an incompatible version. A damaged
+        # pickle can fail with almost any exception so they are all treated alike.
+        loaded = None
+
+      # Keep only well formed {path: (mtime_ns, size, objects)} entries
+      if isinstance(loaded, dict):
+        self.object_cache = {path: entry for path, entry in loaded.items()
+          if isinstance(path, str) and isinstance(entry, tuple) and len(entry) == 3}
 
   def extract_objects(self, fname, type_filter=None):
     '''Extract objects from a source file.
@@ -364,14 +639,15 @@ class VerilogExtractor(object):
     Returns:
       list: List of parsed objects, optionally filtered by type.
     '''
-    objects = []
-    if fname in self.object_cache:
-      objects = self.object_cache[fname]
-    else:
+    path, stamp = self._file_stamp(fname)
+
+    objects = self._cached_objects(path, stamp)
+    if objects is None:
       with io.open(fname, 'rt', encoding='utf-8') as fh:
         text = fh.read()
         objects = parse_verilog(text)
-        self.object_cache[fname] = objects
+        self.object_cache[path] = stamp + (objects,)
+        self._cache_dirty = True
 
     if type_filter:
       objects = [o for o in objects if isinstance(o, type_filter)]
@@ -379,16 +655,100 @@ class VerilogExtractor(object):
     return objects
 
 
+  def extract_objects_many(self, fnames, type_filter=None, workers=None):
+    '''Extract objects from several source files.
+
+    Files that are not already cached are parsed in parallel by a pool of worker processes.
+
+    Args:
+      fnames (list of str): Names of files to read from.
+      type_filter (class, optional): Object class to filter results (e.g., VerilogModule).
+      workers (int, optional): Maximum number of worker processes. Defaults to the CPU count.
+    Returns:
+      list: List of parsed objects from all files in order, optionally filtered by type.
+    '''
+    stamps = [self._file_stamp(fname) for fname in fnames]
+
+    # Parse each uncached file once even if it is listed more than once
+    missing = {}
+    for fname, (path, stamp) in zip(fnames, stamps):
+      if self._cached_objects(path, stamp) is None:
+        missing.setdefault(path, (fname, stamp))
+
+    if len(missing) == 1:
+      path, (fname, stamp) = missing.popitem()
+      self.object_cache[path] = stamp + (_parse_verilog_file_worker(fname),)
+      self._cache_dirty = True
+
+    elif missing:
+      with ProcessPoolExecutor(workers) as ex:
+        parsed = ex.map(_parse_verilog_file_worker, [fname for fname, _ in missing.values()])
+        # Mark each entry as it is added so files parsed before a worker fails are saved
+        for (path, (fname, stamp)), objects in zip(missing.items(), parsed):
+          self.object_cache[path] = stamp + (objects,)
+          self._cache_dirty = True
+
+    objects = [o for path, _ in stamps for o in self.object_cache[path][2]]
+
+    if type_filter:
+      objects = [o for o in objects if isinstance(o, type_filter)]
+
+    return objects
+
+
+  def _file_stamp(self, fname):
+    '''Get a file's absolute path and the (mtime_ns, size) stamp of its current contents'''
+    st = os.stat(fname)
+    return os.path.abspath(fname), (st.st_mtime_ns, st.st_size)
+
+
+  def _cached_objects(self, path, stamp):
+    '''Get the cached objects for a file or None when they are missing or out of date'''
+    entry = self.object_cache.get(path)
+    if entry is not None and entry[:2] == stamp:
+      return entry[2]
+    return None
+
+
+  def flush(self):
+    '''Save the object cache to the cache file.
+
+    Nothing is written when no cache file was given or nothing new has been parsed.
+    The cache is written to a temporary file that then replaces the cache file so an
+    interrupted or concurrent flush never leaves a partially written cache behind.
+    '''
+    if self.cache_file is None or not self._cache_dirty:
+      return
+
+    cache_dir = os.path.dirname(self.cache_file)
+    if cache_dir:
+      os.makedirs(cache_dir, exist_ok=True)
+
+    fd, tmp_file = tempfile.mkstemp(prefix=os.path.basename(self.cache_file) + '.',
+      suffix='.tmp', dir=cache_dir or os.curdir)
+    try:
+      with io.open(fd, 'wb') as fh:
+        pickle.dump(self.object_cache, fh, pickle.HIGHEST_PROTOCOL)
+      os.replace(tmp_file, self.cache_file)
+    except BaseException:
+      os.unlink(tmp_file)
+      raise
+    self._cache_dirty = False
+
+
   def extract_objects_from_source(self, text, type_filter=None):
     '''Extract object declarations from a text buffer.
 
+    Parse results are cached for all extractors but every call returns new objects so
+    changes made to them do not affect later calls.
+
     Args:
       text (str): Source code to parse.
       type_filter (class, optional): Object class to filter results (e.g., VerilogModule).
     Returns:
       list: List of parsed objects, optionally filtered by type.
     '''
-    objects = parse_verilog(text)
+    objects = pickle.loads(_parse_verilog_cached(text))
 
     if type_filter:
       objects = [o for o in objects if isinstance(o, type_filter)]
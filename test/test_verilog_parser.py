@@ -1,58 +1,47 @@
 import unittest
 import os
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tempfile
+import pickle
+from textwrap import dedent
+
+# Make the package importable when the tests are run directly from a source checkout
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
 
 from hdlparse.verilog_parser import (
     parse_verilog,
     VerilogModule,
     VerilogParameter,
     VerilogPort,
-    VerilogSubModule
+    VerilogPortView,
+    VerilogSubModule,
+    VerilogExtractor
 )
 
-class TestVerilogParser(unittest.TestCase):
-    def test_basic_module(self):
-        """Test parsing a basic module without ports"""
-        verilog = """
+# Verilog sources shared by the parser tests, dedented at import and parsed once per test run
+SNIPPETS = {
+    "basic": dedent("""
         module basic_module();
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 1)
-        self.assertEqual(modules[0].name, "basic_module")
-        self.assertEqual(len(modules[0].ports), 0)
-
-    def test_module_with_ports(self):
-        """Test parsing a module with input and output ports"""
-        verilog = """
+        """),
+    "ports": dedent("""
         module port_module(
             input clk,
             output reg [7:0] data
         );
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 1)
-        module = modules[0]
-        self.assertEqual(module.name, "port_module")
-        self.assertEqual(len(module.ports), 2)
-        
-        # Check input port
-        clk_port = next(p for p in module.ports if p.name == "clk")
-        self.assertIsInstance(clk_port, VerilogPort)
-        self.assertEqual(clk_port.mode, "input")
-        self.assertEqual(clk_port.data_type, "wire")
-        
-        # Check output port
-        data_port = next(p for p in module.ports if p.name == "data")
-        self.assertIsInstance(data_port, VerilogPort)
-        self.assertEqual(data_port.mode, "output")
-        self.assertEqual(data_port.data_type, "reg [7:0]")
-
-    def test_module_with_parameters(self):
-        """Test parsing a module with parameters"""
-        verilog = """
+        """),
+    "port_arrays": dedent("""
+        module array_module(
+            input clk,
+            output reg [7:0] data,
+            input clk
+        );
+        endmodule
+        """),
+    "parameters": dedent("""
         module param_module #(
             parameter WIDTH = 8,
             parameter [7:0] ADDR = 8'hFF
@@ -60,25 +49,8 @@ class TestVerilogParser(unittest.TestCase):
             input clk
         );
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 1)
-        module = modules[0]
-        
-        # Check parameters
-        width_param = next(p for p in module.generics if p.name == "WIDTH")
-        self.assertIsInstance(width_param, VerilogParameter)
-        self.assertEqual(width_param.data_type, "wire")
-        self.assertEqual(width_param.default_value, "8")
-        
-        addr_param = next(p for p in module.generics if p.name == "ADDR")
-        self.assertIsInstance(addr_param, VerilogParameter)
-        self.assertEqual(addr_param.data_type, "wire [7:0]")
-        self.assertEqual(addr_param.default_value, "8'hFF")
-
-    def test_module_with_submodules(self):
-        """Test parsing a module with submodule instances"""
-        verilog = """
+        """),
+    "submodules": dedent("""
         module top_module(
             input clk,
             input rst
@@ -93,25 +65,8 @@ class TestVerilogParser(unittest.TestCase):
                 .rst(rst)
             );
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 1)
-        module = modules[0]
-        self.assertEqual(len(module.submodules), 2)
-        
-        # Check first submodule
-        sub1 = module.submodules[0]
-        self.assertEqual(sub1.module_type, "sub_module")
-        self.assertEqual(sub1.instance_name, "instance1")
-        
-        # Check second submodule
-        sub2 = module.submodules[1]
-        self.assertEqual(sub2.module_type, "sub_module")
-        self.assertEqual(sub2.instance_name, "instance2")
-
-    def test_module_with_comments(self):
-        """Test parsing a module with comments and metacomments"""
-        verilog = """
+        """),
+    "comments": dedent("""
         // This is a test module
         module comment_module(
             input clk,  // Clock input
@@ -121,16 +76,8 @@ class TestVerilogParser(unittest.TestCase):
             /* Block comment
                spanning multiple lines */
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 1)
-        module = modules[0]
-        self.assertEqual(module.name, "comment_module")
-        self.assertEqual(len(module.ports), 2)
-
-    def test_multiple_modules(self):
-        """Test parsing multiple modules in the same file"""
-        verilog = """
+        """),
+    "multiple": dedent("""
         module module1(
             input clk
         );
@@ -140,15 +87,20 @@ class TestVerilogParser(unittest.TestCase):
             input rst
         );
         endmodule
-        """
-        modules = parse_verilog(verilog)
-        self.assertEqual(len(modules), 2)
-        self.assertEqual(modules[0].name, "module1")
-        self.assertEqual(modules[1].name, "module2")
-
-    def test_complex_module(self):
-        """Test parsing a complex module with all features"""
-        verilog = """
+        """),
+    "commented_out": dedent("""
+        `timescale 1ns / 1ps
+        /* module block_commented(input a);
+           endmodule */
+        // module line_commented(input a);
+        module real_module(
+            input clk
+        );
+        endmodule // module trailing(input a);
+        """),
+    # A line comment at the very end of the text with no newline to close it
+    "eof_comment": "module kept(input a);\nendmodule\n// module hidden(input b); endmodule",
+    "complex": dedent("""
         // Complex module test
         module complex_module #(
             parameter WIDTH = 8,
@@ -172,125 +124,264 @@ class TestVerilogParser(unittest.TestCase):
                 .data(data[7:0])
             );
         endmodule
-        """
-        modules = parse_verilog(verilog)
+        """),
+}
+
+# Expected module names and port counts for the shared sources
+CASES = [
+    ("basic", {"modules": ["basic_module"], "port_counts": [0]}),
+    ("ports", {"modules": ["port_module"], "port_counts": [2]}),
+    ("comments", {"modules": ["comment_module"], "port_counts": [2]}),
+    ("multiple", {"modules": ["module1", "module2"], "port_counts": [1, 1]}),
+    ("eof_comment", {"modules": ["kept"], "port_counts": [1]}),
+    ("complex", {"modules": ["complex_module"], "port_counts": [4]}),
+]
+
+class TestVerilogParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parsed = {key: parse_verilog(text) for key, text in SNIPPETS.items()}
+
+        # Read and parse UDP module file
+        with open(os.path.join(os.path.dirname(__file__), 'udp.v'), 'r') as f:
+            cls.parsed["udp"] = parse_verilog(f.read())
+
+    def test_module_shapes(self):
+        """Test the modules and port counts found in each shared source"""
+        for name, expected in CASES:
+            with self.subTest(name=name):
+                modules = self.parsed[name]
+                self.assertEqual([m.name for m in modules], expected["modules"])
+                self.assertEqual([len(m.ports) for m in modules], expected["port_counts"])
+
+    def test_module_with_ports(self):
+        """Test parsing a module with input and output ports"""
+        module = self.parsed["ports"][0]
+        self.assertTrue(all(isinstance(p, VerilogPort) for p in module.ports))
+        self.assertEqual([(p.name, p.mode, p.data_type) for p in module.ports], [
+            ("clk", "input", "wire"),
+            ("data", "output", "reg [7:0]"),
+        ])
+
+    def test_port_arrays(self):
+        """Test that ports are stored as arrays with views for each port"""
+        # Parsed locally since the ports are modified through their views below
+        module = parse_verilog(SNIPPETS["port_arrays"])[0]
+        self.assertEqual(module.port_names, ["clk", "data"])
+        self.assertEqual(module.port_modes, ["input", "output"])
+        self.assertEqual(module.port_data_types, ["wire", "reg [7:0]"])
+        self.assertEqual(module.port_descs, [None, None])
+
+        data_port = module.ports[1]
+        self.assertIsInstance(data_port, VerilogPortView)
+        data_port.desc = "Output data"
+        self.assertEqual(module.port_descs[1], "Output data")
+        self.assertEqual(module.ports[1].desc, "Output data")
+
+        # Views of the same port are interchangeable
+        self.assertEqual(module.ports[1], data_port)
+        self.assertIn(data_port, module.ports)
+        self.assertEqual(module.ports.index(data_port), 1)
+        self.assertEqual(module.ports[-1], data_port)
+        self.assertNotEqual(module.ports[0], data_port)
+
+        # The port views are read-only; the arrays hold the ports
+        with self.assertRaises((AttributeError, TypeError)):
+            module.ports.append(VerilogPort("extra", "input", "wire"))
+        self.assertEqual(module.port_names, ["clk", "data"])
+
+    def test_module_with_parameters(self):
+        """Test parsing a module with parameters"""
+        modules = self.parsed["parameters"]
         self.assertEqual(len(modules), 1)
         module = modules[0]
-        
+        self.assertTrue(all(isinstance(p, VerilogParameter) for p in module.generics))
+        self.assertEqual([(p.name, p.data_type, p.default_value) for p in module.generics], [
+            ("WIDTH", "wire", "8"),
+            ("ADDR", "wire [7:0]", "8'hFF"),
+        ])
+
+    def test_module_with_submodules(self):
+        """Test parsing a module with submodule instances"""
+        modules = self.parsed["submodules"]
+        self.assertEqual(len(modules), 1)
+        module = modules[0]
+        self.assertEqual([(s.module_type, s.instance_name) for s in module.submodules], [
+            ("sub_module", "instance1"),
+            ("sub_module", "instance2"),
+        ])
+
+    def test_commented_out_modules(self):
+        """Test that module declarations inside comments are ignored"""
+        modules = self.parsed["commented_out"]
+        self.assertEqual([m.name for m in modules], ["real_module"])
+        self.assertEqual([p.name for p in modules[0].ports], ["clk"])
+
+    def test_complex_module(self):
+        """Test parsing a complex module with all features"""
+        module = self.parsed["complex"][0]
+
         # Check parameters
-        width_param = next(p for p in module.generics if p.name == "WIDTH")
-        self.assertIsInstance(width_param, VerilogParameter)
-        self.assertEqual(width_param.data_type, "wire")
-        self.assertEqual(width_param.default_value, "8")
-        
-        addr_param = next(p for p in module.generics if p.name == "ADDR")
-        self.assertIsInstance(addr_param, VerilogParameter)
-        self.assertEqual(addr_param.data_type, "wire [7:0]")
-        self.assertEqual(addr_param.default_value, "8'hFF")
-        
+        self.assertTrue(all(isinstance(p, VerilogParameter) for p in module.generics))
+        self.assertEqual([(p.name, p.data_type, p.default_value) for p in module.generics], [
+            ("WIDTH", "wire", "8"),
+            ("ADDR", "wire [7:0]", "8'hFF"),
+        ])
+
         # Check ports
-        self.assertEqual(len(module.ports), 4)
-        clk_port = next(p for p in module.ports if p.name == "clk")
-        self.assertIsInstance(clk_port, VerilogPort)
-        self.assertEqual(clk_port.mode, "input")
-        
-        data_port = next(p for p in module.ports if p.name == "data")
-        self.assertIsInstance(data_port, VerilogPort)
-        self.assertEqual(data_port.mode, "output")
-        self.assertEqual(data_port.data_type, "reg [WIDTH-1:0]")
-        
+        self.assertTrue(all(isinstance(p, VerilogPort) for p in module.ports))
+        self.assertEqual([(p.name, p.mode, p.data_type) for p in module.ports], [
+            ("clk", "input", "wire"),
+            ("rst_n", "input", "wire"),
+            ("data", "output", "reg [WIDTH-1:0]"),
+            ("sda", "inout", "wire"),
+        ])
+
         # Check submodules
-        self.assertEqual(len(module.submodules), 2)
-        sub1 = module.submodules[0]
-        self.assertEqual(sub1.module_type, "sub_module")
-        self.assertEqual(sub1.instance_name, "sub1")
+        self.assertEqual([(s.module_type, s.instance_name) for s in module.submodules], [
+            ("sub_module", "sub1"),
+            ("sub_module", "sub2"),
+        ])
 
     def test_udp_module(self):
         """Test parsing the UDP module"""
-        # Read and parse UDP module file
-        with open(os.path.join(os.path.dirname(__file__), 'udp.v'), 'r') as f:
-            udp_text = f.read()
-        modules = parse_verilog(udp_text)
+        modules = self.parsed["udp"]
         
         # Find the main UDP module
-        udp_module = next(m for m in modules if m.name == "udp")
+        udp_module = {m.name: m for m in modules}["udp"]
         
         # Test module parameters
-        self.assertEqual(len(udp_module.generics), 3)
-        params = {p.name: p for p in udp_module.generics}
-        
-        # Check CHECKSUM_GEN_ENABLE parameter
-        self.assertIn('CHECKSUM_GEN_ENABLE', params)
-        self.assertEqual(params['CHECKSUM_GEN_ENABLE'].default_value, '1')
-        
-        # Check CHECKSUM_PAYLOAD_FIFO_DEPTH parameter
-        self.assertIn('CHECKSUM_PAYLOAD_FIFO_DEPTH', params)
-        self.assertEqual(params['CHECKSUM_PAYLOAD_FIFO_DEPTH'].default_value, '2048')
-        
-        # Check CHECKSUM_HEADER_FIFO_DEPTH parameter
-        self.assertIn('CHECKSUM_HEADER_FIFO_DEPTH', params)
-        self.assertEqual(params['CHECKSUM_HEADER_FIFO_DEPTH'].default_value, '8')
-        
-        # Test ports
-        self.assertGreater(len(udp_module.ports), 0)
-        ports = {p.name: p for p in udp_module.ports}
-        
-        # Check clock and reset
-        self.assertIn('clk', ports)
-        self.assertEqual(ports['clk'].mode, 'input')
-        self.assertIn('rst', ports)
-        self.assertEqual(ports['rst'].mode, 'input')
-        
-        # Check some IP frame input ports
-        self.assertIn('s_ip_hdr_valid', ports)
-        self.assertEqual(ports['s_ip_hdr_valid'].mode, 'input')
-        self.assertIn('s_ip_hdr_ready', ports)
-        self.assertEqual(ports['s_ip_hdr_ready'].mode, 'output')
-        
-        # Check some UDP frame output ports
-        self.assertIn('m_udp_hdr_valid', ports)
-        self.assertEqual(ports['m_udp_hdr_valid'].mode, 'output')
-        self.assertIn('m_udp_hdr_ready', ports)
-        self.assertEqual(ports['m_udp_hdr_ready'].mode, 'input')
-        
-        # Check vector ports
-        self.assertIn('s_ip_eth_dest_mac', ports)
-        self.assertEqual(ports['s_ip_eth_dest_mac'].mode, 'input')
-        self.assertEqual(ports['s_ip_eth_dest_mac'].data_type, 'wire [47:0]')
-        
-        # Check status signals
-        self.assertIn('rx_busy', ports)
-        self.assertEqual(ports['rx_busy'].mode, 'output')
-        self.assertIn('tx_busy', ports)
-        self.assertEqual(ports['tx_busy'].mode, 'output')
-        
-        # Should have three submodules: udp_ip_rx, udp_ip_tx, udp_checksum_gen
-        self.assertEqual(len(udp_module.submodules), 3, 
-            f"Expected 3 submodules but found {len(udp_module.submodules)}")
-        
-        # Check udp_ip_rx submodule
-        try:
-            udp_ip_rx = next(s for s in udp_module.submodules if s.module_type == 'udp_ip_rx')
-            self.assertEqual(udp_ip_rx.instance_name, 'udp_ip_rx_inst')
-        except StopIteration:
-            print("\nERROR: Could not find udp_ip_rx submodule")
-            raise
-
-        # Check udp_ip_tx submodule
-        try:
-            udp_ip_tx = next(s for s in udp_module.submodules if s.module_type == 'udp_ip_tx')
-            self.assertEqual(udp_ip_tx.instance_name, 'udp_ip_tx_inst')
-        except StopIteration:
-            print("\nERROR: Could not find udp_ip_tx submodule")
-            raise
-
-        # Check udp_checksum_gen submodule (if CHECKSUM_GEN_ENABLE is 1)
-        try:
-            udp_checksum_gen = next(s for s in udp_module.submodules if s.module_type == 'udp_checksum_gen')
-            self.assertEqual(udp_checksum_gen.instance_name, 'udp_checksum_gen_inst')
-        except StopIteration:
-            print("\nERROR: Could not find udp_checksum_gen submodule")
-            raise
+        self.assertEqual({p.name: p.default_value for p in udp_module.generics}, {
+            'CHECKSUM_GEN_ENABLE': '1',
+            'CHECKSUM_PAYLOAD_FIFO_DEPTH': '2048',
+            'CHECKSUM_HEADER_FIFO_DEPTH': '8',
+        })
+
+        # Test a selection of ports: clock and reset, IP frame inputs,
+        # UDP frame outputs, a vector port, and status signals
+        expected_ports = {
+            'clk': ('input', 'wire'),
+            'rst': ('input', 'wire'),
+            's_ip_hdr_valid': ('input', 'wire'),
+            's_ip_hdr_ready': ('output', 'wire'),
+            'm_udp_hdr_valid': ('output', 'wire'),
+            'm_udp_hdr_ready': ('input', 'wire'),
+            's_ip_eth_dest_mac': ('input', 'wire [47:0]'),
+            'rx_busy': ('output', 'wire'),
+            'tx_busy': ('output', 'wire'),
+        }
+        ports = {p.name: (p.mode, p.data_type) for p in udp_module.ports if p.name in expected_ports}
+        self.assertEqual(ports, expected_ports)
+
+        # Should have three submodules: udp_ip_rx, udp_ip_tx, and udp_checksum_gen
+        # (present when CHECKSUM_GEN_ENABLE is 1)
+        self.assertCountEqual([(s.module_type, s.instance_name) for s in udp_module.submodules], [
+            ('udp_ip_rx', 'udp_ip_rx_inst'),
+            ('udp_ip_tx', 'udp_ip_tx_inst'),
+            ('udp_checksum_gen', 'udp_checksum_gen_inst'),
+        ])
+
+class TestVerilogExtractor(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.vfile = os.path.join(self.tmpdir.name, 'top.v')
+        self.write_source("module first(input a);\nendmodule\n")
+
+    def write_source(self, text):
+        with open(self.vfile, 'w') as f:
+            f.write(text)
+
+    def test_cache_invalidated_on_edit(self):
+        """Test that an edited file is parsed again and replaces its cache entry"""
+        extractor = VerilogExtractor()
+        modules = extractor.extract_objects(self.vfile)
+        self.assertEqual([m.name for m in modules], ["first"])
+        self.assertIs(extractor.extract_objects(self.vfile), modules)
+
+        self.write_source("module second(input a, input b);\nendmodule\n")
+        modules = extractor.extract_objects(self.vfile)
+        self.assertEqual([m.name for m in modules], ["second"])
+        self.assertEqual(len(extractor.object_cache), 1)
+
+    def test_cache_file_round_trip(self):
+        """Test that a flushed cache is reused by a new extractor"""
+        cache_file = os.path.join(self.tmpdir.name, 'cache', 'verilog_cache.pkl')
+        extractor = VerilogExtractor(cache_file)
+        extractor.extract_objects(self.vfile)
+        extractor.flush()
+        self.assertTrue(os.path.exists(cache_file))
+
+        extractor = VerilogExtractor(cache_file)
+        self.assertEqual(len(extractor.object_cache), 1)
+        modules = extractor.extract_objects(self.vfile, VerilogModule)
+        self.assertEqual([m.name for m in modules], ["first"])
+        self.assertEqual([p.name for p in modules[0].ports], ["a"])
+
+    def test_cache_file_invalid(self):
+        """Test that a cache file not holding a cache is ignored"""
+        cache_file = os.path.join(self.tmpdir.name, 'verilog_cache.pkl')
+        with open(cache_file, 'wb') as f:
+            pickle.dump(['not', 'a', 'cache'], f)
+
+        extractor = VerilogExtractor(cache_file)
+        self.assertEqual(extractor.object_cache, {})
+        modules = extractor.extract_objects(self.vfile)
+        self.assertEqual([m.name for m in modules], ["first"])
+
+    def test_cache_file_corrupt(self):
+        """Test that a damaged cache file is ignored and replaced on flush"""
+        cache_file = os.path.join(self.tmpdir.name, 'verilog_cache.pkl')
+        # A string opcode holding invalid UTF-8 fails with UnicodeDecodeError
+        with open(cache_file, 'wb') as f:
+            f.write(b'\x80\x04X\x02\x00\x00\x00\xff\xfe.')
+
+        extractor = VerilogExtractor(cache_file)
+        self.assertEqual(extractor.object_cache, {})
+        extractor.extract_objects(self.vfile)
+        extractor.flush()
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ['top.v', 'verilog_cache.pkl'])
+        self.assertEqual(len(VerilogExtractor(cache_file).object_cache), 1)
+
+    def test_extract_objects_many(self):
+        """Test parsing several files in parallel"""
+        other = os.path.join(self.tmpdir.name, 'other.v')
+        with open(other, 'w') as f:
+            f.write("module second(input b);\nendmodule\nmodule third;\nendmodule\n")
+
+        extractor = VerilogExtractor()
+        modules = extractor.extract_objects_many([self.vfile, other, self.vfile], workers=2)
+        self.assertEqual([m.name for m in modules], ["first", "second", "third", "first"])
+        self.assertEqual(len(extractor.object_cache), 2)
+        self.assertIs(extractor.extract_objects(other)[0], modules[1])
+
+    def test_extract_objects_many_partial_failure(self):
+        """Test that files parsed before a worker fails are still flushed"""
+        bad = os.path.join(self.tmpdir.name, 'bad.v')
+        with open(bad, 'wb') as f:
+            f.write(b"module bad(input \xff);\nendmodule\n")
+        cache_file = os.path.join(self.tmpdir.name, 'verilog_cache.pkl')
+
+        extractor = VerilogExtractor(cache_file)
+        with self.assertRaises(UnicodeDecodeError):
+            extractor.extract_objects_many([self.vfile, bad], workers=2)
+        extractor.flush()
+        self.assertEqual(len(VerilogExtractor(cache_file).object_cache), 1)
+
+    def test_source_cache_shared(self):
+        """Test that cached source text gives each caller independent objects"""
+        text = "module shared(input a);\nendmodule\n"
+        modules = VerilogExtractor().extract_objects_from_source(text)
+        modules[0].desc = "Changed"
+        modules[0].ports[0].desc = "Changed port"
+        modules[0].generics.append(VerilogParameter("P"))
+
+        again = VerilogExtractor().extract_objects_from_source(text, VerilogModule)
+        self.assertEqual([m.name for m in again], ["shared"])
+        self.assertIsNot(again[0], modules[0])
+        self.assertIsNone(again[0].desc)
+        self.assertEqual(again[0].port_descs, [None])
+        self.assertEqual(again[0].generics, [])
 
 
 if __name__ == '__main__':